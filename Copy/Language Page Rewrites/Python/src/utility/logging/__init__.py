@@ -1,10 +1,31 @@
+import atexit
 import logging
+import logging.handlers
 
 
 class Logger(logging.Logger):
+    # Handler shared by all Logger instances, so output goes through a single stream (and lock).
+    handler = None
+
     def __init__(self, name, level=0):
         super(Logger, self).__init__(name, level)
-        handler = logging.StreamHandler()
-        # Default to WARNING level.
-        handler.setLevel(level or logging.WARNING)
-        self.addHandler(handler)
\ No newline at end of file
+        # Default to WARNING level. Filtering is done per logger, since the handler is shared.
+        self.setLevel(level or logging.WARNING)
+        if Logger.handler is None:
+            # Buffer records and write them in batches, rather than once per record.
+            Logger.handler = logging.handlers.MemoryHandler(capacity=1024,
+                                                            flushLevel=logging.ERROR,
+                                                            target=logging.StreamHandler())
+            # Write any still-buffered records on exit.
+            atexit.register(Logger.handler.flush)
+        self.addHandler(Logger.handler)
+
+    def log_exception(self, exception: BaseException, expected: bool = True):
+        """Logs the passed BaseException at ERROR level, including traceback.
+
+        :param exception: The BaseException to log.
+        :param expected: Determines if BaseException was expected.
+        """
+        # Pass arguments separately, so logging only formats them if ERROR is enabled.
+        self.error('[%s] %s: %s', 'EXPECTED' if expected else 'UNEXPECTED', type(exception).__name__, exception,
+                   exc_info=exception)
\ No newline at end of file
@@ -1,12 +1,22 @@
 import decimal
-from enum import Enum
+import functools
+from enum import IntEnum
 
 import sys
 from gw_utility.logging import Logging
 from mpmath import mp
+import numpy as np
+from numba import njit
 
+# Shared decimal.Decimal constants, to avoid reconstructing them on every loop iteration.
+_D1 = decimal.Decimal(1)
+_D2 = decimal.Decimal(2)
+_D4 = decimal.Decimal(4)
+_D8 = decimal.Decimal(8)
+_D16 = decimal.Decimal(16)
 
-class PiLibType(Enum):
+
+class PiLibType(IntEnum):
     """Specifies library choices that are used to help calculate pi values."""
     INTEGER = 1
     FLOAT = 2
@@ -61,14 +71,9 @@ def get_pi(precision, lib: PiLibType = PiLibType.INTEGER):
     :return: Pi value with specified precision.
     """
     try:
-        if lib == PiLibType.INTEGER:
-            return pi_using_integer(precision)
-        elif lib == PiLibType.FLOAT:
-            return pi_using_float(precision)
-        elif lib == PiLibType.DECIMAL:
-            return pi_using_decimal_lib(precision)
-        elif lib == PiLibType.MPMATH:
-            return pi_using_mpmath_lib(precision)
+        function = _DISPATCH.get(lib)
+        # Unknown library returns None (no calculation).
+        return None if function is None else function(precision)
     except OverflowError as error:
         # Output expected OverflowErrors.
         Logging.log_exception(error)
@@ -84,14 +89,31 @@ def pi_using_integer(precision):
     :param precision: Precision to retrieve.
     :return: Pi value with specified precision.
     """
-    value = 0
-    for k in range(precision):
-        value += 1 / 16 ** k * (
-            4 / (8 * k + 1) -
-            2 / (8 * k + 4) -
-            1 / (8 * k + 5) -
-            1 / (8 * k + 6)
+    return _pi_using_integer_kernel(precision)
+
+
+@njit(cache=True)
+def _pi_using_integer_kernel(precision):
+    """Natively compiled BBP summation loop used by pi_using_integer.
+    Numba doesn't support arbitrary try/except blocks in nopython mode, so errors are handled by the caller.
+
+    :param precision: Precision to retrieve.
+    :return: Pi value with specified precision.
+    """
+    value = 0.
+    # Running 1 / 16 ** k, updated each iteration rather than recomputing the power.
+    inv16k = 1.
+    # Running 8 * k + 1, incremented each iteration rather than multiplied.
+    base = 1
+    for _ in range(precision):
+        value += inv16k * (
+            4 / base -
+            2 / (base + 3) -
+            1 / (base + 4) -
+            1 / (base + 5)
         )
+        inv16k *= 1 / 16
+        base += 8
     return value
 
 
@@ -99,22 +121,62 @@ def pi_using_float(precision):
     """Get value of pi via BBP formula to specified precision using floats.
     See: https://en.wikipedia.org/wiki/Bailey%E2%80%93Borwein%E2%80%93Plouffe_formula
 
+    Terms are computed as a single vectorized NumPy expression. A scalar 16. ** k raises
+    OverflowError once k reaches 256, so each term is instead scaled by a running product
+    of 1 / 16, which harmlessly underflows to zero.
+
     :param precision: Precision to retrieve.
     :return: Pi value with specified precision.
     """
-    value = 0
-    for k in range(precision):
-        # Dot suffix converts value to a Float.
-        value += 1. / 16. ** k * (
-            4. / (8. * k + 1.) -
-            2. / (8. * k + 4.) -
-            1. / (8. * k + 5.) -
-            1. / (8. * k + 6.)
-        )
-    return value
+    # Negative precision sums no terms (like an empty range()), rather than being an invalid array size.
+    precision = max(precision, 0)
+    # 8 * k + 1: [1, 9, 17, ...].
+    base = np.arange(1., 8. * precision, 8.)
+    # Running 1 / 16 ** k: [1, 1/16, 1/256, ...].
+    inv16k = np.full(precision, 1. / 16.)
+    if precision:
+        inv16k[0] = 1.
+    np.cumprod(inv16k, out=inv16k)
+    terms = inv16k * (
+        4. / base -
+        2. / (base + 3.) -
+        1. / (base + 4.) -
+        1. / (base + 5.)
+    )
+    # Add terms in k order, like the original loop, since numpy's pairwise sum() can round the last digit differently.
+    return sum(terms.tolist())
+
+
+# Decimal pi values already computed via Chudnovsky, keyed by precision.
+_decimal_pi_cache = {}
+
+
+def pi_using_decimal_lib(precision, bbp: bool = False):
+    """Get value of pi via Chudnovsky algorithm to specified precision using decimal library.
+    See: https://en.wikipedia.org/wiki/Chudnovsky_algorithm
 
-
-def pi_using_decimal_lib(precision):
+    :param precision: Precision to retrieve.
+    :param bbp: Determines if the (much slower) BBP formula should be used instead.
+    :return: Pi value with specified precision.
+    """
+    # Set precision for decimal library.
+    decimal.getcontext().prec = precision
+    if bbp:
+        return pi_using_decimal_lib_bbp(precision)
+
+    if precision not in _decimal_pi_cache:
+        # Each term adds roughly 14 digits.
+        _, q, t = chudnovsky_split(1, precision // 14 + 2)
+        with decimal.localcontext() as context:
+            # Use guard digits to avoid rounding errors in final digits.
+            context.prec += 10
+            value = (426880 * context.sqrt(decimal.Decimal(10005)) * q) / (13591409 * q + t)
+        # Unary plus rounds value to the requested precision.
+        _decimal_pi_cache[precision] = +value
+    return _decimal_pi_cache[precision]
+
+
+def pi_using_decimal_lib_bbp(precision):
     """Get value of pi via BBP formula to specified precision using decimal library.
     See: https://en.wikipedia.org/wiki/Bailey%E2%80%93Borwein%E2%80%93Plouffe_formula
 
@@ -124,16 +186,42 @@ def pi_using_decimal_lib(precision):
     # Set precision for decimal library.
     decimal.getcontext().prec = precision
     value = 0
-    for k in range(precision):
-        value += decimal.Decimal(1) / decimal.Decimal(16) ** k * (
-            decimal.Decimal(4) / (decimal.Decimal(8) * k + decimal.Decimal(1)) -
-            decimal.Decimal(2) / (decimal.Decimal(8) * k + decimal.Decimal(4)) -
-            decimal.Decimal(1) / (decimal.Decimal(8) * k + decimal.Decimal(5)) -
-            decimal.Decimal(1) / (decimal.Decimal(8) * k + decimal.Decimal(6))
+    # Running 1 / 16 ** k, updated each iteration rather than recomputing the power.
+    inv16 = _D1 / _D16
+    inv16k = _D1
+    # Running 8 * k + 1, incremented each iteration rather than multiplied.
+    base = _D1
+    for _ in range(precision):
+        value += inv16k * (
+            _D4 / base -
+            _D2 / (base + 3) -
+            _D1 / (base + 4) -
+            _D1 / (base + 5)
         )
+        inv16k *= inv16
+        base += _D8
     return value
 
 
+def chudnovsky_split(a, b):
+    """Get binary splitting terms of Chudnovsky series over range [a, b), using integers.
+    See: https://en.wikipedia.org/wiki/Chudnovsky_algorithm#Python_code
+
+    :param a: First term index (inclusive).
+    :param b: Last term index (exclusive).
+    :return: Tuple of P, Q, and T terms.
+    """
+    if b - a == 1:
+        p = -(6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+        q = 10939058860032000 * a ** 3
+        t = p * (545140134 * a + 13591409)
+        return p, q, t
+    m = (a + b) // 2
+    p_am, q_am, t_am = chudnovsky_split(a, m)
+    p_mb, q_mb, t_mb = chudnovsky_split(m, b)
+    return p_am * p_mb, q_am * q_mb, q_mb * t_am + p_am * t_mb
+
+
 def pi_using_mpmath_lib(precision):
     """Get value of pi to specified precision using mpmath library.
 
@@ -141,9 +229,31 @@ def pi_using_mpmath_lib(precision):
     :return: Pi value with specified precision.
     """
     # Set decimal points (mpmath automatically sets precision when dps is set).
+    # Still required on cached calls, since mpf values are output using current dps.
     mp.dps = precision
     # Get pi value to specified precision.
-    return mp.pi
+    return _mpmath_pi(precision)
+
+
+@functools.lru_cache(maxsize=None)
+def _mpmath_pi(precision):
+    """Get cached mpmath pi value with specified precision.
+
+    :param precision: Precision to retrieve.
+    :return: Pi value with specified precision.
+    """
+    mp.dps = precision
+    # Unary plus evaluates constant at current precision into a new mpf.
+    return +mp.pi
+
+
+# Pi calculation functions, keyed by PiLibType.
+_DISPATCH = {
+    PiLibType.INTEGER: pi_using_integer,
+    PiLibType.FLOAT: pi_using_float,
+    PiLibType.DECIMAL: pi_using_decimal_lib,
+    PiLibType.MPMATH: pi_using_mpmath_lib,
+}
 
 
 if __name__ == "__main__":
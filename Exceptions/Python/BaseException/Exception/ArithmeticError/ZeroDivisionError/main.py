@@ -1,11 +1,12 @@
 import decimal
-from enum import Enum
+import operator
+from enum import IntEnum
 
 from gw_utility.logging import Logging
 from mpmath import mpf
 
 
-class NumberType(Enum):
+class NumberType(IntEnum):
     """Specifies number type or library used for calculating values."""
     INTEGER = 1
     FLOAT = 2
@@ -13,6 +14,19 @@ class NumberType(Enum):
     MPMATH = 4
 
 
+# Division functions, keyed by NumberType.
+_DISPATCH = {
+    # Divide using standard integer.
+    NumberType.INTEGER: operator.truediv,
+    # Convert to floats before division.
+    NumberType.FLOAT: lambda numerator, denominator: float(numerator) / float(denominator),
+    # Divide the decimal.Decimal value.
+    NumberType.DECIMAL: lambda numerator, denominator: decimal.Decimal(numerator) / decimal.Decimal(denominator),
+    # Divide using the mpmath.mpf (real float) value.
+    NumberType.MPMATH: lambda numerator, denominator: mpf(numerator) / mpf(denominator),
+}
+
+
 def main():
     Logging.line_separator("FRACTION TEST", 40, '+')
 
@@ -55,21 +69,8 @@ def divide(numerator, denominator, lib: NumberType = NumberType.INTEGER):
     :return: Division result.
     """
     try:
-        if lib == NumberType.INTEGER:
-            # Divide using standard integer.
-            return numerator / denominator
-        elif lib == NumberType.FLOAT:
-            # Convert to floats before division.
-            return float(numerator) / float(denominator)
-        elif lib == NumberType.DECIMAL:
-            # Divide the decimal.Decimal value.
-            return decimal.Decimal(numerator) / decimal.Decimal(denominator)
-        elif lib == NumberType.MPMATH:
-            # Divide using the mpmath.mpf (real float) value.
-            return mpf(numerator) / mpf(denominator)
-        else:
-            # Divide using standard integer (default).
-            return numerator / denominator
+        # Divide using standard integer by default.
+        return _DISPATCH.get(lib, operator.truediv)(numerator, denominator)
     except ZeroDivisionError as error:
         # Output expected ZeroDivisionErrors.
         Logging.log_exception(error)
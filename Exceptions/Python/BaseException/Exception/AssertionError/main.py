@@ -3,19 +3,23 @@ import datetime
 from gw_utility.book import Book
 from gw_utility.logging import Logging
 
+# Publication dates, shared since datetime.date instances are immutable.
+_D_STAND = datetime.date(1978, 1, 1)
+_D_HOBBIT = datetime.date(1937, 9, 15)
+
 
 def main():
     Logging.line_separator("BOTH INCLUDE PUBLICATION DATES", 50, '+')
     # Create two Books with identical arguments.
-    the_stand = Book("The Stand", "Stephen King", 1153, datetime.date(1978, 1, 1))
-    the_stand_2 = Book("The Stand", "Stephen King", 1153, datetime.date(1978, 1, 1))
+    the_stand = Book("The Stand", "Stephen King", 1153, _D_STAND)
+    the_stand_2 = Book("The Stand", "Stephen King", 1153, _D_STAND)
 
     # Check equivalency of Books.
     check_equality(the_stand, the_stand_2)
 
     Logging.line_separator("ONE MISSING PUBLICATION DATE", 50, '+')
     # Create two Books, one without publication_date argument specified.
-    the_hobbit = Book("The Hobbit", "J.R.R. Tolkien", 366, datetime.date(1937, 9, 15))
+    the_hobbit = Book("The Hobbit", "J.R.R. Tolkien", 366, _D_HOBBIT)
     the_hobbit_2 = Book("The Hobbit", "J.R.R. Tolkien", 366)
 
     # Check equivalency of Books.
@@ -3,6 +3,9 @@ import datetime
 from gw_utility.book import Book
 from gw_utility.logging import Logging
 
+# Publication dates, shared since datetime.date instances are immutable.
+_D_HOBBIT = datetime.date(1937, 9, 15)
+
 
 def main():
     test()
@@ -12,7 +15,7 @@ def test():
     try:
         Logging.line_separator("CREATE BOOK", 50, '+')
         # Create and output book.
-        book = Book("The Hobbit", "J.R.R. Tolkien", 366, datetime.date(1937, 9, 15))
+        book = Book("The Hobbit", "J.R.R. Tolkien", 366, _D_HOBBIT)
         Logging.log(book)
 
         # Output valid attributes.
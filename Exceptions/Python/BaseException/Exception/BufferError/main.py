@@ -2,6 +2,9 @@ import io
 
 from gw_utility.logging import Logging
 
+# Byte array with string 'Hello', reused across buffer tests.
+array = io.BytesIO(b'Hello')
+
 
 def main():
     buffer_test()
@@ -9,21 +12,25 @@ def main():
 
 def output_buffer(view: memoryview):
     Logging.line_separator("BUFFER OUTPUT")
-    Logging.log(f'tobytes(): {view.tobytes()}')
-    Logging.log(f'tolist(): {view.tolist()}')
-    Logging.log(f'hex(): {view.hex()}')
+    # Copy view contents once, then derive all output from the copy.
+    data = view.tobytes()
+    Logging.log(f'tobytes(): {data}\n'
+                f'tolist(): {list(data)}\n'
+                f'hex(): {data.hex()}')
 
 
 def buffer_test():
     try:
-        # Create byte array with string 'Hello'.
-        array = io.BytesIO(b'Hello')
         # Create a read-write copy of the bytearray.
         view = array.getbuffer()
-        # Output copied memory view.
-        output_buffer(view)
-        # Add string ' world!' to existing bytearray.
-        array.write(b' world!')
+        try:
+            # Output copied memory view.
+            output_buffer(view)
+            # Add string ' world!' to existing bytearray.
+            array.write(b' world!')
+        finally:
+            # Release view, so array can be resized by subsequent calls.
+            view.release()
     except BufferError as error:
         # Output expected BufferErrors.
         Logging.log_exception(error)
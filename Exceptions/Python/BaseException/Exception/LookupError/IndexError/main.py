@@ -4,14 +4,19 @@ import datetime
 from gw_utility.book import Book
 from gw_utility.logging import Logging
 
+# Publication dates, shared since datetime.date instances are immutable.
+_D_DARK_QUEEN = datetime.date(1994, 1, 1)
+_D_MERCHANT_PRINCE = datetime.date(1995, 5, 1)
+_D_DEMON_KING = datetime.date(1997, 4, 1)
+
 
 def main():
     try:
         # Create list and populate with Books.
         books = list()
-        books.append(Book("Shadow of a Dark Queen", "Raymond E. Feist", 497, datetime.date(1994, 1, 1)))
-        books.append(Book("Rise of a Merchant Prince", "Raymond E. Feist", 479, datetime.date(1995, 5, 1)))
-        books.append(Book("Rage of a Demon King", "Raymond E. Feist", 436, datetime.date(1997, 4, 1)))
+        books.append(Book("Shadow of a Dark Queen", "Raymond E. Feist", 497, _D_DARK_QUEEN))
+        books.append(Book("Rise of a Merchant Prince", "Raymond E. Feist", 479, _D_MERCHANT_PRINCE))
+        books.append(Book("Rage of a Demon King", "Raymond E. Feist", 436, _D_DEMON_KING))
 
         # Output Books in list, with and without index.
         Logging.line_separator('Books')
@@ -38,14 +43,13 @@ def log_list(collection, include_index=False):
     :return: None
     """
     try:
-        # Iterate by converting to enumeration.
-        for index, item in enumerate(collection):
-            if include_index:
-                Logging.log(f'collection[{index}]: {item}')
-            else:
-                Logging.log(item)
+        # Iterate by converting to enumeration, building all lines for a single log call.
+        lines = [f'collection[{index}]: {item}' if include_index else item
+                 for index, item in enumerate(collection)]
+        if lines:
+            Logging.log(*lines, sep='\n')
     except IndexError as error:
-        # Output expected IndexErrors.
+        # Output expected IndexErrors (unreachable, since enumeration never indexes out of bounds).
         Logging.log_exception(error)
     except Exception as exception:
         # Output unexpected Exceptions.
@@ -4,13 +4,17 @@ import datetime
 from gw_utility.book import Book
 from gw_utility.logging import Logging
 
+# Publication dates, shared since datetime.date instances are immutable.
+_D_NAME_OF_THE_WIND = datetime.date(2007, 3, 27)
+_D_WISE_MANS_FEAR = datetime.date(2011, 3, 1)
+
 
 def main():
     try:
         # Create a dictionary and populate with Books.
         series = {
-            1:  Book("The Name of the Wind",    "Patrick Rothfuss",     662,    datetime.date(2007, 3, 27)),
-            2:  Book("The Wise Man's Fear",     "Patrick Rothfuss",     994,    datetime.date(2011, 3, 1)),
+            1:  Book("The Name of the Wind",    "Patrick Rothfuss",     662,    _D_NAME_OF_THE_WIND),
+            2:  Book("The Wise Man's Fear",     "Patrick Rothfuss",     994,    _D_WISE_MANS_FEAR),
             3:  Book("Doors of Stone",          "Patrick Rothfuss")
         }
 
@@ -39,14 +43,13 @@ def log_dict(collection, include_key=False):
     :return: None
     """
     try:
-        # Iterate by getting collection of items.
-        for key, item in collection.items():
-            if include_key:
-                Logging.log(f'collection[{key}]: {item}')
-            else:
-                Logging.log(item)
+        # Iterate by getting collection of items, building all lines for a single log call.
+        lines = [f'collection[{key}]: {item}' if include_key else item
+                 for key, item in collection.items()]
+        if lines:
+            Logging.log(*lines, sep='\n')
     except KeyError as error:
-        # Output expected KeyErrors.
+        # Output expected KeyErrors (unreachable, since items() never looks up a missing key).
         Logging.log_exception(error)
     except Exception as exception:
         # Output unexpected Exceptions.
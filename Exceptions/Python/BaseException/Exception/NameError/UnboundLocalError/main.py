@@ -1,5 +1,7 @@
 import datetime
 import dis
+import io
+import os
 
 from gw_utility.book import Book
 from gw_utility.logging import Logging
@@ -16,15 +18,16 @@ def main():
         # Set global book title.
         set_global_book_title("The Silmarillion")
 
-        # Disassemble functions.
-        Logging.line_separator("DISASSEMBLY OF increment_count.", 60)
-        disassemble_object(increment_local_count)
+        # Disassemble functions (only if DEBUG_DIS environment variable is set).
+        if os.environ.get('DEBUG_DIS'):
+            Logging.line_separator("DISASSEMBLY OF increment_count.", 60)
+            disassemble_object(increment_local_count)
 
-        Logging.line_separator("DISASSEMBLY OF set_local_book_title.", 60)
-        disassemble_object(set_local_book_title)
+            Logging.line_separator("DISASSEMBLY OF set_local_book_title.", 60)
+            disassemble_object(set_local_book_title)
 
-        Logging.line_separator("DISASSEMBLY OF set_global_book_title.", 60)
-        disassemble_object(set_global_book_title)
+            Logging.line_separator("DISASSEMBLY OF set_global_book_title.", 60)
+            disassemble_object(set_global_book_title)
     except NameError as error:
         # Output expected NameErrors.
         Logging.log_exception(error)
@@ -96,7 +99,10 @@ def disassemble_object(value):
     :param value: Object to be disassembled.
     :return: None
     """
-    dis.dis(value)
+    # Collect full disassembly, then output with a single log call.
+    with io.StringIO() as output:
+        dis.dis(value, file=output)
+        Logging.log(output.getvalue(), end='')
 
 
 if __name__ == "__main__":
@@ -1,14 +1,19 @@
 import datetime
 import dis
+import io
+import os
 
 from gw_utility.book import Book
 from gw_utility.logging import Logging
 
+# Publication dates, shared since datetime.date instances are immutable.
+_D_HOBBIT = datetime.date(1937, 9, 15)
+
 
 def main():
     try:
         # Create Book.
-        book = Book("The Hobbit", "J.R.R. Tolkien", 366, datetime.date(1937, 9, 15))
+        book = Book("The Hobbit", "J.R.R. Tolkien", 366, _D_HOBBIT)
 
         # Log book object.
         Logging.line_separator("log_object(book)", 60)
@@ -18,12 +23,13 @@ def main():
         Logging.line_separator("log_invalid_object(book)", 60)
         log_invalid_object(book)
 
-        # Disassemble both log_ functions.
-        Logging.line_separator("DISASSEMBLY OF log_object()", 60)
-        disassemble_object(log_object)
+        # Disassemble both log_ functions (only if DEBUG_DIS environment variable is set).
+        if os.environ.get('DEBUG_DIS'):
+            Logging.line_separator("DISASSEMBLY OF log_object()", 60)
+            disassemble_object(log_object)
 
-        Logging.line_separator("DISASSEMBLY OF log_invalid_object()", 60)
-        disassemble_object(log_invalid_object)
+            Logging.line_separator("DISASSEMBLY OF log_invalid_object()", 60)
+            disassemble_object(log_invalid_object)
     except NameError as error:
         # Output expected NameErrors.
         Logging.log_exception(error)
@@ -70,7 +76,10 @@ def disassemble_object(value):
     :param value: Object to be disassembled.
     :return: None
     """
-    dis.dis(value)
+    # Collect full disassembly, then output with a single log call.
+    with io.StringIO() as output:
+        dis.dis(value, file=output)
+        Logging.log(output.getvalue(), end='')
 
 
 if __name__ == "__main__":
@@ -3,6 +3,11 @@ import ssl
 
 from gw_utility.logging import Logging
 
+# SSLContext shared by all SSL sockets, created once rather than per connection.
+_SSL_CTX = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+_SSL_CTX.check_hostname = False
+_SSL_CTX.verify_mode = ssl.CERT_NONE
+
 
 def main():
     try:
@@ -41,9 +46,8 @@ def get_socket(host, is_ssl=False, is_blocking=True):
     """
     try:
         if is_ssl:
-            # If SSL is necessary then wrap socket in SSLContext object.
-            context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
-            s = context.wrap_socket(socket.socket(socket.AF_INET, socket.SOCK_STREAM))
+            # If SSL is necessary then wrap socket in shared SSLContext object.
+            s = _SSL_CTX.wrap_socket(socket.socket(socket.AF_INET, socket.SOCK_STREAM), server_hostname=host)
             s.setblocking(is_blocking)
             s.connect((host, 443))
             return s
@@ -73,19 +77,25 @@ def get_socket_response(s, request, max_bytes=4096):
         if s is None:
             return None
 
-        data = bytearray()
+        # Pre-size data array, so responses are received directly into it without reallocation.
+        data = bytearray(max_bytes)
+        offset = 0
 
         # Send request.
         s.send(request)
 
-        while True:
-            # Get response and extend data array.
-            response = s.recv(max_bytes)
-            data.extend(response)
+        with memoryview(data) as view:
+            while True:
+                # Get response into remaining portion of data array.
+                received = s.recv_into(view[offset:])
+                offset += received
+
+                # Break if no bytes, otherwise loop until max_bytes (or all available bytes) received.
+                if received == 0 or offset >= max_bytes or offset == received:
+                    break
 
-            # Break if no bytes, otherwise loop until max_bytes (or all available bytes) received.
-            if len(response) == 0 or len(data) >= max_bytes or len(data) == len(response):
-                break
+        # Trim unused space (only allowed once memoryview is released).
+        del data[offset:]
 
         # Close socket.
         s.close()
@@ -1,26 +1,52 @@
 # eval_syntax_test.py
 import datetime
 from gw_utility.logging import Logging
+from gw_utility.syntax import compile_source
+
+# Day offsets, created once rather than on every evaluation.
+ONE_DAY = datetime.timedelta(days=1)
+TWO_DAYS = datetime.timedelta(days=2)
 
 TOMORROW_DEFINITION = """
-f'Tomorrow is {(today + datetime.timedelta(days=1)).strftime("%A, %B %d, %Y")}'
+f'Tomorrow is {(today + ONE_DAY).strftime("%A, %B %d, %Y")}'
 """
 
 DAY_AFTER_TOMORROW_DEFINITION = """
-f'The day after tomorrow is {(today + datetime.timedelta(days=2))strftime("%A, %B %d, %Y")}'
+f'The day after tomorrow is {(today + TWO_DAYS)strftime("%A, %B %d, %Y")}'
 """
 
+# Compile each definition once, at import, so it isn't re-parsed on every invocation.
+TOMORROW_CODE, TOMORROW_ERROR = compile_source(TOMORROW_DEFINITION, 'eval')
+DAY_AFTER_TOMORROW_CODE, DAY_AFTER_TOMORROW_ERROR = compile_source(DAY_AFTER_TOMORROW_DEFINITION, 'eval')
+
+
+def evaluate(code, error, namespace):
+    """Evaluates compiled code within passed namespace, or raises the SyntaxError found when compiling its source.
+
+    :param code: Compiled code object (None if source was invalid).
+    :param error: SyntaxError found when compiling source, if any.
+    :param namespace: Globals for evaluated code.
+    :return: Result of evaluation.
+    """
+    if error:
+        # Clear traceback of any previous raise, so it doesn't grow on every call.
+        raise error.with_traceback(None)
+    return eval(code, namespace)
+
 
 def main():
     try:
         today = datetime.datetime.now()
         Logging.log(f'Today is {today.strftime("%A, %B %d, %Y")}')
 
+        # Explicit globals for evaluated code, rather than implicitly capturing current frame.
+        namespace = {'today': today, 'ONE_DAY': ONE_DAY, 'TWO_DAYS': TWO_DAYS}
+
         Logging.log("Invoking: eval(TOMORROW_DEFINITION)")
-        Logging.log(eval(TOMORROW_DEFINITION))
+        Logging.log(evaluate(TOMORROW_CODE, TOMORROW_ERROR, namespace))
 
         Logging.log("Invoking: eval(DAY_AFTER_TOMORROW_DEFINITION)")
-        Logging.log(eval(DAY_AFTER_TOMORROW_DEFINITION))
+        Logging.log(evaluate(DAY_AFTER_TOMORROW_CODE, DAY_AFTER_TOMORROW_ERROR, namespace))
     except SyntaxError as error:
         # Output expected SyntaxErrors.
         Logging.log_exception(error)
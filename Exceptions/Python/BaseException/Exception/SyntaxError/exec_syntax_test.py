@@ -1,5 +1,6 @@
 # exec_syntax_test.py
 from gw_utility.logging import Logging
+from gw_utility.syntax import compile_source
 
 DOUBLE_DEFINITION = """
 def double(x):
@@ -19,18 +20,41 @@ TRIPLE_EXECUTOR = """
 Logging.log(triple(5)
 """
 
+# Compile each definition once, at import, so it isn't re-parsed on every invocation.
+DOUBLE_DEFINITION_CODE, DOUBLE_DEFINITION_ERROR = compile_source(DOUBLE_DEFINITION)
+DOUBLE_EXECUTOR_CODE, DOUBLE_EXECUTOR_ERROR = compile_source(DOUBLE_EXECUTOR)
+TRIPLE_DEFINITION_CODE, TRIPLE_DEFINITION_ERROR = compile_source(TRIPLE_DEFINITION)
+TRIPLE_EXECUTOR_CODE, TRIPLE_EXECUTOR_ERROR = compile_source(TRIPLE_EXECUTOR)
+
+
+def execute(code, error, namespace):
+    """Executes compiled code within passed namespace, or raises the SyntaxError found when compiling its source.
+
+    :param code: Compiled code object (None if source was invalid).
+    :param error: SyntaxError found when compiling source, if any.
+    :param namespace: Globals shared by executed code.
+    :return: None
+    """
+    if error:
+        # Clear traceback of any previous raise, so it doesn't grow on every call.
+        raise error.with_traceback(None)
+    exec(code, namespace)
+
 
 def main():
     try:
+        # Shared globals, so executors can resolve functions created by definitions.
+        namespace = {'Logging': Logging}
+
         Logging.log("Invoking: exec(DOUBLE_DEFINITION)")
-        exec(DOUBLE_DEFINITION)
+        execute(DOUBLE_DEFINITION_CODE, DOUBLE_DEFINITION_ERROR, namespace)
         Logging.log("Invoking: exec(DOUBLE_EXECUTOR)")
-        exec(DOUBLE_EXECUTOR)
+        execute(DOUBLE_EXECUTOR_CODE, DOUBLE_EXECUTOR_ERROR, namespace)
 
         Logging.log("Invoking: exec(TRIPLE_DEFINITION)")
-        exec(TRIPLE_DEFINITION)
+        execute(TRIPLE_DEFINITION_CODE, TRIPLE_DEFINITION_ERROR, namespace)
         Logging.log("Invoking: exec(TRIPLE_EXECUTOR)")
-        exec(TRIPLE_EXECUTOR)
+        execute(TRIPLE_EXECUTOR_CODE, TRIPLE_EXECUTOR_ERROR, namespace)
     except SyntaxError as error:
         # Output expected SyntaxErrors.
         Logging.log_exception(error)
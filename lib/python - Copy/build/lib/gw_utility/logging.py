@@ -1,7 +1,5 @@
 import math
 
-from overloading import overload
-
 
 class Logging:
 
@@ -9,18 +7,8 @@ class Logging:
     separator_length_default = 40
 
     @classmethod
-    def log(cls, value: str):
-        cls.output(value)
-
-    @classmethod
-    @overload
-    def log(cls, value: int):
-        cls.output(value)
-
-    @classmethod
-    @overload
     def log(cls, value: object):
-        cls.output(value)
+        print(value)
 
     @classmethod
     def output(cls, value):
@@ -3,14 +3,19 @@ import datetime
 
 
 class Book:
+    __slots__ = ('author', 'page_count', 'publication_date', 'title', '_key', '_str_cache')
+
     author: str
     page_count: int
     publication_date: datetime.date
     title: str
+    _key: tuple
 
     def __eq__(self, other):
         """Determines if passed object is equivalent to current object."""
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, Book):
+            return NotImplemented
+        return self._key == other._key
 
     def __init__(self,
                  title: str = None,
@@ -24,20 +29,38 @@ class Book:
         :param page_count: Page Count of Book.
         :param publication_date: Publication Date of Book.
         """
-        self.author = author
-        self.page_count = page_count
-        self.publication_date = publication_date
-        self.title = title
-
-    def __getattr__(self, name: str):
-        """Returns the attribute matching passed name."""
-        # Get internal dict value matching name.
-        value = self.__dict__.get(name)
-        if not value:
-            # Raise AttributeError if attribute value not found.
-            raise AttributeError(f'{self.__class__.__name__}.{name} is invalid.')
-        # Return attribute value.
-        return value
+        # Set slots directly, so only later changes pay for cache handling of __setattr__.
+        object.__setattr__(self, 'author', author)
+        object.__setattr__(self, 'page_count', page_count)
+        object.__setattr__(self, 'publication_date', publication_date)
+        object.__setattr__(self, 'title', title)
+        # Cache attribute values for equivalency checks.
+        object.__setattr__(self, '_key', (title, author, page_count, publication_date))
+        # Cached string representation, built on first use.
+        object.__setattr__(self, '_str_cache', None)
+
+    def __getstate__(self):
+        """Returns attribute values used to copy or pickle Book."""
+        return self.title, self.author, self.page_count, self.publication_date
+
+    def __setstate__(self, state):
+        """Restores attribute values of copied or unpickled Book, bypassing cache handling of __setattr__."""
+        title, author, page_count, publication_date = state
+        object.__setattr__(self, 'author', author)
+        object.__setattr__(self, 'page_count', page_count)
+        object.__setattr__(self, 'publication_date', publication_date)
+        object.__setattr__(self, 'title', title)
+        object.__setattr__(self, '_key', state)
+        object.__setattr__(self, '_str_cache', None)
+
+    def __setattr__(self, name: str, value):
+        """Sets the attribute matching passed name, clearing or refreshing cached values if necessary."""
+        object.__setattr__(self, name, value)
+        if name in ('author', 'page_count', 'publication_date', 'title'):
+            # Clear cached output, which will be rebuilt on next use.
+            object.__setattr__(self, '_str_cache', None)
+            # Keep cached key in sync with changed attribute.
+            object.__setattr__(self, '_key', (self.title, self.author, self.page_count, self.publication_date))
 
     def __len__(self):
         """Returns the length of title."""
@@ -45,6 +68,8 @@ class Book:
 
     def __str__(self):
         """Returns a formatted string representation of Book."""
-        date = '' if self.publication_date is None else f', published on {self.publication_date.__format__("%B %d, %Y")}'
-        pages = '' if self.page_count is None else f' at {self.page_count} pages'
-        return f'\'{self.title}\' by {self.author}{pages}{date}.'
\ No newline at end of file
+        if self._str_cache is None:
+            date = '' if self.publication_date is None else f', published on {self.publication_date.__format__("%B %d, %Y")}'
+            pages = '' if self.page_count is None else f' at {self.page_count} pages'
+            object.__setattr__(self, '_str_cache', f'\'{self.title}\' by {self.author}{pages}{date}.')
+        return self._str_cache
\ No newline at end of file
@@ -1,5 +1,4 @@
 # logging.py
-import math
 import sys
 import traceback
 
@@ -35,17 +34,10 @@ class Logging:
         if value == None or len(value) == 0:
             output = f'{char * length}'
         elif len(value) < length:
-            #   Update length based on insert length, less a space for margin.
-            length -= len(value) + 2
-            #   Halve the length and floor left side.
-            left = math.floor(length / 2)
-            right = left
-            #   If odd number, add dropped remainder to right side.
-            if length % 2 != 0:
-                right += 1
-
-            # Surround insert with separators.
-            output = f'{char * left} {value} {char * right}'
+            # Add a space for margin on each side of insert.
+            padded = f' {value} '
+            # Surround insert with separators, via format centering (places odd remainder on right side).
+            output = f'{padded:{char}^{length}}'
 
         cls.__output(output)
 
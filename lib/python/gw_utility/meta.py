@@ -1,3 +1,6 @@
+from collections import deque
+
+
 class Meta:
     def __init__(self):
         try:
@@ -11,24 +14,18 @@ class Meta:
 
     def inheritors(self, klass):
         subclasses = set()
-        work = [klass]
-        data = dict()
-        data['BaseException'] = {}
+        work = deque([klass])
         while work:
-            parent = work.pop()
+            parent = work.popleft()
             for child in parent.__subclasses__():
-                #   if child.__bases__[0] == parent:
-                if child not in subclasses:
-                    subclasses.add(child)
+                # Only enqueue children not yet seen, hashing each child once.
+                count = len(subclasses)
+                subclasses.add(child)
+                if len(subclasses) != count:
                     work.append(child)
-                    # self.add_to_dict(data, parent.__name__, child.__name__)
 
         for subclass in subclasses:
             print(subclass.__name__)
-        # print(subclasses)
-
-        for blah in data:
-            print(blah)
 
         return subclasses
 
@@ -0,0 +1,15 @@
+# syntax.py
+
+
+def compile_source(source: str, mode: str = 'exec', filename: str = '<string>'):
+    """Compiles passed source once, capturing any syntax error rather than raising it.
+
+    :param source: Source code to be compiled.
+    :param mode: Kind of code to compile ('eval' or 'exec').
+    :param filename: Name to identify source code in error messages.
+    :return: Tuple of compiled code object (None if source is invalid) and SyntaxError (None if source is valid).
+    """
+    try:
+        return compile(source, filename, mode), None
+    except SyntaxError as error:
+        return None, error
\ No newline at end of file
@@ -0,0 +1,37 @@
+import copy
+import datetime
+import pickle
+import unittest
+
+from gw_utility.book import Book
+
+
+class BookTest(unittest.TestCase):
+    def setUp(self):
+        self.book = Book("The Hobbit", "J.R.R. Tolkien", 366, datetime.date(1937, 9, 15))
+
+    def test_copy(self):
+        """Shallow copy is equivalent and keeps working caches."""
+        book = copy.copy(self.book)
+        self.assertEqual(book, self.book)
+        self.assertEqual(str(book), str(self.book))
+        book.title = "The Silmarillion"
+        self.assertNotEqual(book, self.book)
+        self.assertEqual(len(book), len("The Silmarillion"))
+
+    def test_deepcopy(self):
+        """Deep copy is equivalent."""
+        book = copy.deepcopy(self.book)
+        self.assertEqual(book, self.book)
+
+    def test_pickle(self):
+        """Pickle round-trip is equivalent, for every protocol."""
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                book = pickle.loads(pickle.dumps(self.book, protocol))
+                self.assertEqual(book, self.book)
+                self.assertEqual(str(book), str(self.book))
+
+
+if __name__ == '__main__':
+    unittest.main()